@@ -0,0 +1,62 @@
+"""Compare the vectorized renderer with the previous tabulate based display_data.
+
+Run with: python benchmarks/bench_render.py
+"""
+import timeit
+
+import duckdb
+from tabulate import tabulate
+
+from dunky.render import render_table
+
+
+def display_data(header: list, rows: list):
+    """The previous renderer: three tabulate passes over a pandas frame"""
+    return {
+        "data": {
+            "text/latex": tabulate(rows, header, tablefmt="latex_booktabs"),
+            "text/plain": tabulate(rows, header, tablefmt="simple"),
+            "text/html": tabulate(rows, header, tablefmt="html"),
+        },
+        "metadata": {},
+    }
+
+
+def make_table(rows: int, columns: int):
+    expressions = []
+    for i in range(columns):
+        kind = i % 3
+        if kind == 0:
+            expressions.append(f"range + {i} AS c{i}")
+        elif kind == 1:
+            expressions.append(f"(range * {i}) / 7.0 AS c{i}")
+        else:
+            expressions.append(f"'value_' || (range % 97)::VARCHAR AS c{i}")
+    query = f"SELECT {', '.join(expressions)} FROM range({rows})"
+    return duckdb.sql(query).arrow()
+
+
+def bench(name: str, rows: int, columns: int, number: int = 3):
+    table = make_table(rows, columns)
+
+    def legacy():
+        df = table.to_pandas()
+        display_data(df.columns.tolist(), df.values.tolist())
+
+    def vectorized():
+        render_table(table)
+
+    legacy_time = min(timeit.repeat(legacy, number=1, repeat=number))
+    vectorized_time = min(timeit.repeat(vectorized, number=1, repeat=number))
+    print(
+        f"{name:<6} {rows:>7} x {columns:<4} "
+        f"tabulate {legacy_time:8.3f}s  render_table {vectorized_time:8.3f}s  "
+        f"speedup {legacy_time / vectorized_time:6.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    bench("tall", 10_000, 5)
+    bench("tall", 100_000, 5, number=1)
+    bench("wide", 1_000, 200)
+    bench("square", 10_000, 50, number=1)
@@ -3,21 +3,10 @@ import duckdb
 from ipykernel.kernelbase import Kernel
 import os
 import re
-from tabulate import tabulate
 
-
-
-def display_data(header: str, rows: list):
-    """Generate the display data for the Jupyter frontend"""
-    d = {
-        "data": {
-            "text/latex": tabulate(rows, header, tablefmt="latex_booktabs"),
-            "text/plain": tabulate(rows, header, tablefmt="simple"),
-            "text/html": tabulate(rows, header, tablefmt="html"),
-        },
-        "metadata": {},
-    }
-    return d
+from dunky.fetch import fetch_preview, preview_note
+from dunky.render import render_table
+from dunky.threading import QueryCancelledError, QueryExecutor
 
 
 def is_select_query(query: str):
@@ -64,8 +53,18 @@ class DunkyKernel(Kernel):
 
     def __init__(self, **kwargs):
         Kernel.__init__(self, **kwargs)
-        # Catch KeyboardInterrupt, cancel query, raise QueryCancelledError
-        self._conn = duckdb.connect(":memory:")  # nothing is persisted to disk
+        self._db = duckdb.connect(":memory:")  # nothing is persisted to disk
+        # Queries run on a dedicated cursor in a worker thread. On KeyboardInterrupt
+        # the query is interrupted and QueryCancelledError is raised.
+        self._conn = self._db.cursor()
+        self._query_executor = QueryExecutor(interrupt=self._conn.interrupt)
+        # Rows rendered for a result, the remainder is streamed and discarded
+        self._max_rows = int(os.environ.get("DUNKY_MAX_ROWS", 1000))
+        self._batch_size = int(os.environ.get("DUNKY_BATCH_SIZE", 2048))
+        # Drain the full result to report an exact row count for truncated results
+        self._count_rows = os.environ.get("DUNKY_COUNT_ROWS", "false").lower() == "true"
+        # LaTeX output is only needed when exporting notebooks, e.g. to PDF
+        self._latex = os.environ.get("DUNKY_LATEX", "false").lower() == "true"
         self._bootstrap()  # install uc_catalog, delta, load delta, load uc_catalog, create secret
 
     def _bootstrap(self):
@@ -89,12 +88,16 @@ class DunkyKernel(Kernel):
         return bool(pattern.search(query))
 
     def _run_select_query(self, query: str, silent: bool):
-        """Create a pandas dataframe from the result of a select query
+        """Stream the result of a select query in record batches, keep the first rows
         and generate the display data for the Jupyter frontend"""
-        df = self._conn.sql(query).df()  # to pandas df
-        header = df.columns.tolist()
-        rows = df.values.tolist()
-        output = display_data(header, rows)
+        preview = fetch_preview(
+            self._conn.sql(query),
+            max_rows=self._max_rows,
+            batch_size=self._batch_size,
+            count_rows=self._count_rows,
+        )
+        note = preview_note(preview) if preview.truncated else None
+        output = render_table(preview.table, note=note, latex=self._latex)
         if not silent:
             self.send_response(self.iopub_socket, "display_data", output)
 
@@ -102,10 +105,8 @@ class DunkyKernel(Kernel):
         """Run a show query"""
         result = self._conn.sql(query)
         if isinstance(result, duckdb.DuckDBPyRelation):
-            df = result.df()
-            header = df.columns.tolist()
-            rows = df.values.tolist()
-            if len(rows) == 0:
+            table = result.arrow()
+            if table.num_rows == 0:
                 output = {
                     "data": {
                         "text/plain": "No results found.",
@@ -113,7 +114,7 @@ class DunkyKernel(Kernel):
                     "metadata": {},
                 }
             else:
-                output = display_data(header, rows)
+                output = render_table(table, latex=self._latex)
             if not silent:
                 self.send_response(self.iopub_socket, "display_data", output)
             return
@@ -254,30 +255,12 @@ class DunkyKernel(Kernel):
         try:
             if code.startswith("!"):
                 self._run_shell_command(code[1:], silent)
-            elif is_select_query(code):
-                self._run_select_query(code, silent)
-            elif is_show_query(code):
-                self._run_show_query(code, silent)
-            elif is_attach_query(code):
-                self._run_attach_query(code, silent)
-            elif is_detach_query(code):
-                self._run_detach_query(code, silent)
-            elif is_create_external_table_as_select_query(code):
-                self._run_create_external_table_as_select_query(code, silent)
             else:
-                self._run_unknown_query_type(code, silent)
+                self._query_executor.run(self._run_query, args=(code, silent))
+        except QueryCancelledError as e:
+            return self._error_reply(e, ename="QueryCancelledError")
         except Exception as e:
-            output = str(e)
-            self.send_response(
-                self.iopub_socket, "stream", {"name": "stderr", "text": output}
-            )
-            return {
-                "status": "error",
-                "execution_count": self.execution_count,
-                "ename": "ProgrammingError",
-                "evalue": str(e),
-                "traceback": [],
-            }
+            return self._error_reply(e)
         else:
             return {
                 "status": "ok",
@@ -286,6 +269,37 @@ class DunkyKernel(Kernel):
                 "user_expressions": {},
             }
 
+    def _run_query(self, code: str, silent: bool):
+        """Route a query to its handler, runs on the query worker thread"""
+        if is_select_query(code):
+            self._run_select_query(code, silent)
+        elif is_show_query(code):
+            self._run_show_query(code, silent)
+        elif is_attach_query(code):
+            self._run_attach_query(code, silent)
+        elif is_detach_query(code):
+            self._run_detach_query(code, silent)
+        elif is_create_external_table_as_select_query(code):
+            self._run_create_external_table_as_select_query(code, silent)
+        else:
+            self._run_unknown_query_type(code, silent)
+
+    def _error_reply(self, error: Exception, ename: str = "ProgrammingError"):
+        output = str(error)
+        self.send_response(
+            self.iopub_socket, "stream", {"name": "stderr", "text": output}
+        )
+        return {
+            "status": "error",
+            "execution_count": self.execution_count,
+            "ename": ename,
+            "evalue": str(error),
+            "traceback": [],
+        }
+
+    def do_shutdown(self, restart):
+        self._query_executor.close()
+        return super().do_shutdown(restart)
 
 if __name__ == "__main__":
     from ipykernel.kernelapp import IPKernelApp
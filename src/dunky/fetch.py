@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+
+import duckdb
+import pyarrow as pa
+
+
+@dataclass
+class ResultPreview:
+    """The first rows of a query result together with its row count."""
+
+    table: pa.Table
+    total_rows: int
+    exact: bool
+
+    @property
+    def truncated(self) -> bool:
+        return self.total_rows > self.table.num_rows
+
+
+def fetch_preview(
+    relation: duckdb.DuckDBPyRelation,
+    max_rows: int,
+    batch_size: int = 2048,
+    count_rows: bool = False,
+) -> ResultPreview:
+    """Stream the result of a relation in Arrow record batches and keep at most max_rows rows.
+
+    At most one batch beyond the row cap is pulled from the reader. When count_rows is set,
+    the remaining batches are drained one at a time to report the exact row count,
+    otherwise the count is a lower bound.
+    """
+    reader = relation.record_batch(batch_size)
+    schema = reader.schema
+    batches = []
+    kept_rows = 0
+    total_rows = 0
+    exact = True
+    try:
+        for batch in reader:
+            total_rows += batch.num_rows
+            if kept_rows < max_rows:
+                batch = batch.slice(0, max_rows - kept_rows)
+                batches.append(batch)
+                kept_rows += batch.num_rows
+            elif not count_rows:
+                exact = False
+                break
+    finally:
+        reader.close()
+
+    table = pa.Table.from_batches(batches, schema=schema)
+    return ResultPreview(table=table, total_rows=total_rows, exact=exact)
+
+
+def preview_note(preview: ResultPreview) -> str:
+    """Describe which part of a truncated result is shown."""
+    shown = preview.table.num_rows
+    if preview.exact:
+        return f"Showing first {shown} of {preview.total_rows} rows."
+    return f"Showing first {shown} of at least {preview.total_rows} rows."
@@ -0,0 +1,144 @@
+from html import escape
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+COLUMN_SEPARATOR = "  "
+
+
+def _format_with_python(array: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Fallback for types Arrow cannot cast to string, e.g. nested and binary types."""
+    return pa.chunked_array(
+        [
+            pa.array(
+                [None if value is None else str(value) for value in chunk.to_pylist()],
+                type=pa.string(),
+            )
+            for chunk in array.chunks
+        ],
+        type=pa.string(),
+    )
+
+
+def _format_temporal(array: pa.ChunkedArray) -> pa.ChunkedArray:
+    # Arrow always renders microseconds, drop them when they are zero
+    strings = pc.cast(array, pa.string())
+    return pc.replace_substring_regex(strings, pattern=r"\.0+$", replacement="")
+
+
+def format_column(array: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Format a column as strings with a vectorized cast, nulls become empty strings."""
+    array_type = array.type
+    if pa.types.is_dictionary(array_type):
+        array = pc.cast(array, array_type.value_type)
+        array_type = array.type
+
+    if pa.types.is_timestamp(array_type) or pa.types.is_time(array_type):
+        strings = _format_temporal(array)
+    elif (
+        pa.types.is_nested(array_type)
+        or pa.types.is_binary(array_type)
+        or pa.types.is_large_binary(array_type)
+        or pa.types.is_fixed_size_binary(array_type)
+        or pa.types.is_duration(array_type)
+    ):
+        strings = _format_with_python(array)
+    else:
+        try:
+            strings = pc.cast(array, pa.string())
+        except pa.ArrowNotImplementedError:
+            strings = _format_with_python(array)
+    return pc.fill_null(strings, "")
+
+
+def is_numeric(array_type: pa.DataType) -> bool:
+    return (
+        pa.types.is_integer(array_type)
+        or pa.types.is_floating(array_type)
+        or pa.types.is_decimal(array_type)
+    )
+
+
+def _escape_html(strings: pa.ChunkedArray) -> pa.ChunkedArray:
+    for character, entity in (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;")):
+        strings = pc.replace_substring(strings, pattern=character, replacement=entity)
+    return strings
+
+
+def _render_plain(header: list[str], columns: list, numeric: list[bool]) -> str:
+    if not columns:
+        return ""
+    padded = []
+    header_cells = []
+    rule_cells = []
+    last = len(columns) - 1
+    for position, (name, strings, right) in enumerate(zip(header, columns, numeric)):
+        width = len(name)
+        if len(strings):
+            width = max(width, pc.max(pc.utf8_length(strings)).as_py())
+        if right:
+            padded.append(pc.utf8_lpad(strings, width=width))
+        elif position == last:
+            # No trailing whitespace after the last column
+            padded.append(strings)
+        else:
+            padded.append(pc.utf8_rpad(strings, width=width))
+        header_cells.append(name.rjust(width) if right else name.ljust(width))
+        rule_cells.append("-" * width)
+
+    lines = [
+        COLUMN_SEPARATOR.join(header_cells).rstrip(),
+        COLUMN_SEPARATOR.join(rule_cells),
+    ]
+    if len(columns[0]):
+        rows = pc.binary_join_element_wise(*padded, COLUMN_SEPARATOR)
+        lines.extend(rows.to_pylist())
+    return "\n".join(lines)
+
+
+def _render_html(header: list[str], columns: list, numeric: list[bool]) -> str:
+    head = "".join(
+        f'<th style="text-align: {"right" if right else "left"};">{name}</th>'
+        for name, right in zip(header, numeric)
+    )
+    parts = ["<table>", "<thead>", f"<tr>{head}</tr>", "</thead>", "<tbody>"]
+    if columns and len(columns[0]):
+        cells = []
+        for strings, right in zip(columns, numeric):
+            open_tag = '<td style="text-align: right;">' if right else "<td>"
+            cells.append(
+                pc.binary_join_element_wise(open_tag, _escape_html(strings), "</td>", "")
+            )
+        rows = pc.binary_join_element_wise("<tr>", *cells, "</tr>", "")
+        parts.extend(rows.to_pylist())
+    parts.extend(["</tbody>", "</table>"])
+    return "\n".join(parts)
+
+
+def _render_latex(header: list[str], columns: list) -> str:
+    from tabulate import tabulate
+
+    rows = zip(*(strings.to_pylist() for strings in columns))
+    return tabulate(rows, header, tablefmt="latex_booktabs", disable_numparse=True)
+
+
+def render_table(table: pa.Table, note: str = None, latex: bool = False) -> dict:
+    """Generate the display data for the Jupyter frontend from an Arrow table.
+
+    Every column is formatted to strings once and the plain text and HTML outputs
+    are assembled from those string arrays. LaTeX is only rendered when requested.
+    """
+    header = [str(name) for name in table.column_names]
+    columns = [format_column(column) for column in table.columns]
+    numeric = [is_numeric(column.type) for column in table.columns]
+
+    plain = _render_plain(header, columns, numeric)
+    html = _render_html([escape(name) for name in header], columns, numeric)
+    if note:
+        plain += f"\n{note}"
+        html += f"\n<p>{note}</p>"
+
+    data = {"text/plain": plain, "text/html": html}
+    if latex:
+        data["text/latex"] = _render_latex(header, columns)
+    return {"data": data, "metadata": {}}
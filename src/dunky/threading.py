@@ -1,4 +1,5 @@
 import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 
 
 def run_with_timeout(func, args=(), kwargs={}, timeout=5):
@@ -21,3 +22,37 @@ def run_with_timeout(func, args=(), kwargs={}, timeout=5):
     if exception[0]:
         raise exception[0]
     return result[0]
+
+
+class QueryCancelledError(Exception):
+    """Exception raised when a running query is cancelled by a kernel interrupt."""
+
+    pass
+
+
+class QueryExecutor:
+    """Run queries on a dedicated worker thread while the calling thread waits.
+
+    The calling thread stays responsive to KeyboardInterrupt (the Jupyter interrupt
+    button), in which case the running query is interrupted with the given callable.
+    """
+
+    def __init__(self, interrupt):
+        self._interrupt = interrupt
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="dunky-query"
+        )
+
+    def run(self, func, args=(), kwargs={}):
+        future = self._executor.submit(func, *args, **kwargs)
+        try:
+            return future.result()
+        except KeyboardInterrupt:
+            self._interrupt()
+            # Let the worker unwind so the connection is free for the next query
+            wait([future])
+            raise QueryCancelledError("Query cancelled") from None
+
+    def close(self):
+        self._interrupt()
+        self._executor.shutdown(wait=False, cancel_futures=True)
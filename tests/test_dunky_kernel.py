@@ -1,4 +1,4 @@
-import pandas
+import pyarrow as pa
 import pytest
 from unittest.mock import patch, MagicMock
 from dunky.dunky_kernel import (
@@ -9,6 +9,7 @@ from dunky.dunky_kernel import (
     is_detach_query,
     is_create_external_table_as_select_query,
 )
+from dunky.threading import QueryCancelledError
 
 
 @pytest.fixture
@@ -37,14 +38,24 @@ def test_bootstrap(kernel):
 
 def test_select_query_executes_correctly(kernel):
     query = "SELECT * FROM test_table"
-    kernel._conn.sql.return_value.df.return_value = MagicMock(
-        columns=pandas.array(data=["a"]),
-        values=pandas.array(data=pandas.array(data=pandas.array([[1]]))),
-    )
+    kernel._conn.sql.return_value.record_batch.return_value = pa.table(
+        {"a": [1]}
+    ).to_reader()
     kernel._run_select_query(query, silent=False)
     kernel._conn.sql.assert_called_with(query)
 
 
+def test_select_query_truncates_large_result(kernel):
+    kernel._max_rows = 2
+    kernel._conn.sql.return_value.record_batch.return_value = pa.table(
+        {"a": list(range(10))}
+    ).to_reader(max_chunksize=2)
+    with patch.object(kernel, "send_response") as mock_send:
+        kernel._run_select_query("SELECT * FROM test_table", silent=False)
+    output = mock_send.call_args[0][2]
+    assert "Showing first 2 of at least 4 rows." in output["data"]["text/plain"]
+
+
 def test_show_query_executes_correctly(kernel):
     query = "SHOW TABLES"
     kernel._conn.sql.return_value.df.return_value = MagicMock(
@@ -87,6 +98,23 @@ def test_shell_command_executes_correctly(kernel):
         mock_run.assert_called_with(command, shell=True, capture_output=True, text=True)
 
 
+def test_do_execute_runs_query_on_executor(kernel):
+    with patch.object(kernel, "_run_select_query") as mock_select:
+        reply = kernel.do_execute("SELECT 1", silent=True)
+    mock_select.assert_called_once_with("SELECT 1", True)
+    assert reply["status"] == "ok"
+
+
+def test_do_execute_reports_cancelled_query(kernel):
+    with patch.object(
+        kernel._query_executor, "run", side_effect=QueryCancelledError("Query cancelled")
+    ), patch.object(kernel, "send_response"):
+        reply = kernel.do_execute("SELECT 1", silent=False)
+    assert reply["status"] == "error"
+    assert reply["ename"] == "QueryCancelledError"
+    assert reply["evalue"] == "Query cancelled"
+
+
 def test_select_query_identified_correctly():
     query = "SELECT * FROM test_table"
     assert is_select_query(query)
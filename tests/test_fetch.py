@@ -0,0 +1,55 @@
+import duckdb
+import pytest
+from dunky.fetch import fetch_preview, preview_note
+
+
+@pytest.fixture
+def conn():
+    return duckdb.connect(":memory:")
+
+
+def test_fetch_preview_returns_all_rows_of_small_result(conn):
+    preview = fetch_preview(conn.sql("SELECT range AS a FROM range(10)"), max_rows=100)
+    assert preview.table.column_names == ["a"]
+    assert preview.table.num_rows == 10
+    assert preview.total_rows == 10
+    assert preview.exact
+    assert not preview.truncated
+
+
+def test_fetch_preview_caps_rows(conn):
+    preview = fetch_preview(
+        conn.sql("SELECT range AS a FROM range(100000)"), max_rows=5, batch_size=1000
+    )
+    assert preview.table.num_rows == 5
+    assert preview.table.column("a").to_pylist() == [0, 1, 2, 3, 4]
+    assert preview.truncated
+    assert not preview.exact
+    assert preview.total_rows < 100000
+
+
+def test_fetch_preview_counts_all_rows(conn):
+    preview = fetch_preview(
+        conn.sql("SELECT range AS a FROM range(100000)"),
+        max_rows=5,
+        batch_size=1000,
+        count_rows=True,
+    )
+    assert preview.table.num_rows == 5
+    assert preview.total_rows == 100000
+    assert preview.exact
+
+
+def test_fetch_preview_keeps_schema_of_empty_result(conn):
+    preview = fetch_preview(
+        conn.sql("SELECT range AS a, 'x' AS b FROM range(0)"), max_rows=5
+    )
+    assert preview.table.column_names == ["a", "b"]
+    assert preview.total_rows == 0
+
+
+def test_preview_note(conn):
+    preview = fetch_preview(
+        conn.sql("SELECT range AS a FROM range(50)"), max_rows=5, count_rows=True
+    )
+    assert preview_note(preview) == "Showing first 5 of 50 rows."
@@ -0,0 +1,67 @@
+import datetime
+
+import pyarrow as pa
+from dunky.render import format_column, render_table
+
+
+def test_format_column_casts_numbers_and_fills_nulls():
+    column = pa.chunked_array([[1, None, 3]])
+    assert format_column(column).to_pylist() == ["1", "", "3"]
+
+
+def test_format_column_drops_zero_fraction_of_timestamps():
+    column = pa.chunked_array(
+        [[datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 1, 0, 0, 0, 5)]]
+    )
+    assert format_column(column).to_pylist() == [
+        "2024-01-01 00:00:00",
+        "2024-01-01 00:00:00.000005",
+    ]
+
+
+def test_format_column_falls_back_for_nested_types():
+    column = pa.chunked_array([[[1, 2], None]])
+    assert format_column(column).to_pylist() == ["[1, 2]", ""]
+
+
+def test_format_column_decodes_dictionaries():
+    column = pa.chunked_array([pa.array(["a", "b", "a"]).dictionary_encode()])
+    assert format_column(column).to_pylist() == ["a", "b", "a"]
+
+
+def test_render_table_plain_text_aligns_columns():
+    table = pa.table({"id": [1, 22], "name": ["x", "yy"]})
+    output = render_table(table)
+    assert output["data"]["text/plain"] == "\n".join(
+        [
+            "id  name",
+            "--  ----",
+            " 1  x",
+            "22  yy",
+        ]
+    )
+
+
+def test_render_table_html_escapes_values():
+    table = pa.table({"<a>": ["<b>&"]})
+    html = render_table(table)["data"]["text/html"]
+    assert "<th style=\"text-align: left;\">&lt;a&gt;</th>" in html
+    assert "<tr><td>&lt;b&gt;&amp;</td></tr>" in html
+
+
+def test_render_table_only_renders_latex_when_asked():
+    table = pa.table({"a": [1]})
+    assert "text/latex" not in render_table(table)["data"]
+    assert "\\toprule" in render_table(table, latex=True)["data"]["text/latex"]
+
+
+def test_render_table_appends_note():
+    table = pa.table({"a": [1]})
+    output = render_table(table, note="Showing first 1 of 2 rows.")
+    assert output["data"]["text/plain"].endswith("\nShowing first 1 of 2 rows.")
+    assert output["data"]["text/html"].endswith("<p>Showing first 1 of 2 rows.</p>")
+
+
+def test_render_table_handles_empty_table():
+    table = pa.table({"a": pa.array([], pa.int64())})
+    assert render_table(table)["data"]["text/plain"] == "a\n-"
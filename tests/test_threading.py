@@ -1,6 +1,8 @@
+import _thread
+import duckdb
 import pytest
 import threading
-from dunky.threading import run_with_timeout
+from dunky.threading import QueryCancelledError, QueryExecutor, run_with_timeout
 
 
 def test_function_completes_within_timeout():
@@ -41,3 +43,42 @@ def test_function_with_kwargs():
 
     result = run_with_timeout(greet, kwargs={"name": "Alice"}, timeout=2)
     assert result == "Hello, Alice!"
+
+
+def test_query_executor_returns_result():
+    executor = QueryExecutor(interrupt=lambda: None)
+    assert executor.run(lambda a, b: a + b, args=(2, 3)) == 5
+    executor.close()
+
+
+def test_query_executor_runs_on_worker_thread():
+    executor = QueryExecutor(interrupt=lambda: None)
+    thread_name = executor.run(lambda: threading.current_thread().name)
+    assert thread_name.startswith("dunky-query")
+    executor.close()
+
+
+def test_query_executor_raises_exception():
+    def error_function():
+        raise ValueError("An error occurred")
+
+    executor = QueryExecutor(interrupt=lambda: None)
+    with pytest.raises(ValueError, match="An error occurred"):
+        executor.run(error_function)
+    executor.close()
+
+
+def test_query_executor_interrupts_running_query():
+    conn = duckdb.connect(":memory:")
+    cursor = conn.cursor()
+    executor = QueryExecutor(interrupt=cursor.interrupt)
+    # Simulate the Jupyter interrupt button, which sends SIGINT to the kernel
+    timer = threading.Timer(0.5, _thread.interrupt_main)
+    timer.start()
+    with pytest.raises(QueryCancelledError, match="Query cancelled"):
+        executor.run(
+            lambda: cursor.sql("SELECT sum(range * 2) FROM range(1000000000000)").fetchall()
+        )
+    # The cursor is usable again after the cancelled query
+    assert executor.run(lambda: cursor.sql("SELECT 42").fetchall()) == [(42,)]
+    executor.close()